@@ -1,5 +1,6 @@
 import asyncio
 
+from http import HTTPStatus
 from typing import Any, Awaitable, Callable, Optional, Tuple, Union
 
 from aiohttp import (
@@ -10,6 +11,7 @@ from aiohttp import (
     ClientTimeout,
 )
 
+from helixswarm.helpers import TTLCache
 from helixswarm.swarm import Response, Swarm, SwarmError
 
 
@@ -60,7 +62,8 @@ class SwarmAsyncClient(Swarm):
                  verify: bool = True,
                  timeout: Optional[float] = None,
                  retry: Optional[dict] = None,
-                 auth_update_callback: Optional[Callable[[], Awaitable[Tuple[str, str]]]] = None
+                 auth_update_callback: Optional[Callable[[], Awaitable[Tuple[str, str]]]] = None,
+                 cache_ttl: float = 0
                  ) -> None:
         """
         Swarm async client class.
@@ -107,6 +110,15 @@ class SwarmAsyncClient(Swarm):
                 Callback function which will be called on SwarmUnauthorizedError
                 to update user and password and retry request again.
 
+            cache_ttl (float):
+                Time in seconds to cache responses of read-only info endpoints
+                like ``groups.get_info()`` and ``reviews.get_info()``. Modifying
+                requests to the same path or its sub-paths (for instance
+                ``reviews/1/vote``) drop cached entries, ``reviews.archive()``
+                drops all cached reviews. Changes made through other endpoints
+                (comments, activities, tests) are visible only after entry
+                expiration. Disabled by default (0).
+
         Returns:
             SwarmAsyncClient: instance
         """
@@ -117,6 +129,9 @@ class SwarmAsyncClient(Swarm):
         self.auth = BasicAuth(user, password)
         self.auth_update_callback = auth_update_callback
 
+        if cache_ttl > 0:
+            self.cache = TTLCache(cache_ttl)
+
         if retry:
             self._validate_retry_argument(retry)
             self.session = RetryClientSession(retry)
@@ -128,6 +143,12 @@ class SwarmAsyncClient(Swarm):
         if timeout:
             self.timeout = ClientTimeout(total=timeout)
 
+    async def __aenter__(self) -> 'SwarmAsyncClient':
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
     async def close(self) -> None:  # type: ignore
         await self.session.close()
 
@@ -136,9 +157,18 @@ class SwarmAsyncClient(Swarm):
                       method: str,
                       path: str,
                       fcb: Optional[Callable] = None,
+                      *,
+                      cached: bool = False,
                       **kwargs: Any
                       ) -> dict:
 
+        key = self._get_cache_key(path, cached, kwargs)
+        cached_body, generation = self._cache_get(key)
+        if cached_body is not None:
+            return callback(Response(HTTPStatus.OK, cached_body), fcb)
+
+        self._invalidate_cache(method, path)
+
         if self.timeout and 'timeout' not in kwargs:
             kwargs['timeout'] = self.timeout
 
@@ -155,8 +185,26 @@ class SwarmAsyncClient(Swarm):
         )
 
         body = await response.text()
+
+        self._invalidate_cache(method, path)
+
+        self._cache_set(key, response.status, body, generation)
+
         return callback(Response(response.status, body), fcb)
 
+    async def _request_data(self,  # type: ignore
+                            method: str,
+                            path: str,
+                            data: dict
+                            ) -> dict:
+        if self.api_versions is None:
+            await self.get_version()  # type: ignore
+
+        if 11 in self.api_versions:  # type: ignore
+            return await self._request(method, path, json=data)  # type: ignore
+
+        return await self._request(method, path, data=data)  # type: ignore
+
     async def _update_auth(self) -> Any:
         if self.auth_update_callback is None:
             return
@@ -1,9 +1,11 @@
+from http import HTTPStatus
 from typing import Any, Callable, Optional, Tuple
 
 from requests import Session
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from helixswarm.helpers import TTLCache
 from helixswarm.swarm import Response, Swarm
 
 
@@ -19,7 +21,8 @@ class SwarmClient(Swarm):
                  verify: bool = True,
                  timeout: Optional[float] = None,
                  retry: Optional[dict] = None,
-                 auth_update_callback: Optional[Callable[[], Tuple[str, str]]] = None
+                 auth_update_callback: Optional[Callable[[], Tuple[str, str]]] = None,
+                 cache_ttl: float = 0
                  ) -> None:
         """
         Swarm client class.
@@ -93,6 +96,15 @@ class SwarmClient(Swarm):
                 Callback function which will be called on SwarmUnauthorizedError
                 to update user and password and retry request again.
 
+            cache_ttl (float):
+                Time in seconds to cache responses of read-only info endpoints
+                like ``groups.get_info()`` and ``reviews.get_info()``. Modifying
+                requests to the same path or its sub-paths (for instance
+                ``reviews/1/vote``) drop cached entries, ``reviews.archive()``
+                drops all cached reviews. Changes made through other endpoints
+                (comments, activities, tests) are visible only after entry
+                expiration. Disabled by default (0).
+
         Returns:
             SwarmClient: class instance.
         """
@@ -107,6 +119,9 @@ class SwarmClient(Swarm):
 
         self.auth_update_callback = auth_update_callback
 
+        if cache_ttl > 0:
+            self.cache = TTLCache(cache_ttl)
+
         if not retry:
             return
 
@@ -122,6 +137,12 @@ class SwarmClient(Swarm):
         self.session.mount('http://', adapter)
         self.session.mount('https://', adapter)
 
+    def __enter__(self) -> 'SwarmClient':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
     def close(self) -> None:
         self.session.close()
 
@@ -130,9 +151,18 @@ class SwarmClient(Swarm):
                 method: str,
                 path: str,
                 fcb: Optional[Callable] = None,
+                *,
+                cached: bool = False,
                 **kwargs: Any
                 ) -> dict:
 
+        key = self._get_cache_key(path, cached, kwargs)
+        cached_body, generation = self._cache_get(key)
+        if cached_body is not None:
+            return callback(Response(HTTPStatus.OK, cached_body), fcb)
+
+        self._invalidate_cache(method, path)
+
         if self.timeout and 'timeout' not in kwargs:
             kwargs['timeout'] = self.timeout
 
@@ -147,6 +177,10 @@ class SwarmClient(Swarm):
             **kwargs
         )
 
+        self._invalidate_cache(method, path)
+
+        self._cache_set(key, response.status_code, response.text, generation)
+
         return callback(Response(response.status_code, response.text), fcb)
 
     def _update_auth(self) -> None:
@@ -1,7 +1,45 @@
-from typing import Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from helixswarm.exceptions import SwarmError
-from helixswarm.helpers import minimal_version
+from helixswarm.helpers import build_params, minimal_version
+
+_GET_PARAMS = (
+    ('after', 'after', None),
+    ('limit', 'max', None),
+    ('fields', 'fields', ','.join),
+    ('keywords', 'keywords', None),
+)  # type: Tuple[Tuple[str, str, Optional[Callable]], ...]
+
+_CONFIG_PARAMS = (
+    ('users', 'Users', None),
+    ('owners', 'Owners', None),
+    ('subgroups', 'Subgroups', None),
+    ('name', 'config[name]', None),
+    ('description', 'config[description]', None),
+    ('email_address', 'config[emailAddress]', None),
+    ('notify_reviews', 'config[emailFlags][reviews]', None),
+    ('notify_commits', 'config[emailFlags][commits]', None),
+    ('use_mailing_list', 'config[useMailingList]', None),
+)  # type: Tuple[Tuple[str, str, Optional[Callable]], ...]
+
+_CREATE_PARAMS = _CONFIG_PARAMS + (
+    ('max_results', 'MaxResults', None),
+    ('max_scan_rows', 'MaxScanRows', None),
+    ('max_lock_time', 'MaxLockTime', None),
+    ('max_open_files', 'MaxOpenFiles', None),
+    ('max_memory', 'MaxMemory', None),
+    ('timeout', 'Timeout', None),
+    ('password_timeout', 'PasswordTimeout', None),
+)  # type: Tuple[Tuple[str, str, Optional[Callable]], ...]
+
+
+def _build_group_payload(values: Dict[str, Any], *, limits: bool = False) -> Dict[str, Any]:
+    """
+    Build group members and config payload shared by create and edit, group
+    limits (MaxResults, Timeout, etc) are only accepted on creation.
+    """
+    spec = _CREATE_PARAMS if limits else _CONFIG_PARAMS
+    return build_params(spec, values, keep_false=False)
 
 
 class Groups:
@@ -46,19 +84,7 @@ class Groups:
         Returns:
             dict: json response.
         """
-        params = dict()  # type: Dict[str, Union[str, int]]
-
-        if after:
-            params['after'] = after
-
-        if limit:
-            params['max'] = limit
-
-        if fields:
-            params['fields'] = ','.join(fields)
-
-        if keywords:
-            params['keywords'] = keywords
+        params = build_params(_GET_PARAMS, locals())
 
         return self.swarm._request('GET', 'groups', params=params)
 
@@ -89,8 +115,9 @@ class Groups:
 
         response = self.swarm._request(
             'GET',
-            'groups/{}'.format(identifier),
-            params=params
+            f'groups/{identifier}',
+            params=params,
+            cached=True
         )
 
         return response
@@ -171,66 +198,13 @@ class Groups:
         Returns:
             dict: json response.
         """
-        data = dict()  # type: Dict[str, Union[str, bool, List[str]]]
-
-        data['Group'] = identifier
-
         if not (users or owners or subgroups):
             raise SwarmError('At least one of users, owners, or subgroups is required')
 
-        if users:
-            data['Users'] = users
-
-        if owners:
-            data['Owners'] = owners
-
-        if subgroups:
-            data['Subgroups'] = subgroups
-
-        if name:
-            data['config[name]'] = name
-
-        if description:
-            data['config[description]'] = description
-
-        if email_address:
-            data['config[emailAddress]'] = email_address
-
-        if notify_reviews:
-            data['config[emailFlags][reviews]'] = notify_reviews
-
-        if notify_commits:
-            data['config[emailFlags][commits]'] = notify_commits
-
-        if use_mailing_list:
-            data['config[useMailingList]'] = use_mailing_list
-
-        if max_results:
-            data['MaxResults'] = max_results
+        data = dict(Group=identifier)
+        data.update(_build_group_payload(locals(), limits=True))
 
-        if max_scan_rows:
-            data['MaxScanRows'] = max_scan_rows
-
-        if max_lock_time:
-            data['MaxLockTime'] = max_lock_time
-
-        if max_open_files:
-            data['MaxOpenFiles'] = max_open_files
-
-        if max_memory:
-            data['MaxMemory'] = max_memory
-
-        if timeout:
-            data['Timeout'] = timeout
-
-        if password_timeout:
-            data['PasswordTimeout'] = password_timeout
-
-        version = self.swarm.get_version()
-        if 11 in version['apiVersions']:
-            return self.swarm._request('POST', 'groups', json=data)
-
-        return self.swarm._request('POST', 'groups', data=data)
+        return self.swarm._request_data('POST', 'groups', data)
 
     @minimal_version(2)
     def edit(self,
@@ -288,38 +262,11 @@ class Groups:
         Returns:
             dict: json response.
         """
-        data = dict()  # type: Dict[str, Union[str, bool, List[str]]]
-
-        if users:
-            data['Users'] = users
-
-        if owners:
-            data['Owners'] = owners
-
-        if subgroups:
-            data['Subgroups'] = subgroups
-
-        if name:
-            data['config[name]'] = name
-
-        if description:
-            data['config[description]'] = description
-
-        if email_address:
-            data['config[emailAddress]'] = email_address
-
-        if notify_reviews:
-            data['config[emailFlags][reviews]'] = notify_reviews
-
-        if notify_commits:
-            data['config[emailFlags][commits]'] = notify_commits
-
-        if use_mailing_list:
-            data['config[useMailingList]'] = use_mailing_list
+        data = _build_group_payload(locals())
 
         response = self.swarm._request(
             'PATCH',
-            'groups/{}'.format(identifier),
+            f'groups/{identifier}',
             data=data
         )
 
@@ -337,4 +284,4 @@ class Groups:
         Returns:
             dict: json response.
         """
-        return self.swarm._request('DELETE', 'groups/{}'.format(identifier))
+        return self.swarm._request('DELETE', f'groups/{identifier}')
@@ -1,7 +1,31 @@
 from typing import Callable, Dict, List, Optional, Tuple, Union
 
 from helixswarm.exceptions import SwarmCompatibleError, SwarmError
-from helixswarm.helpers import minimal_version
+from helixswarm.helpers import build_params, minimal_version
+
+# GET filters are always sent in query string (also for API v11+, where JSON
+# body is accepted only for modifying requests), so booleans must be encoded
+_BOOL_STR = {True: '1', False: '0'}
+
+_GET_PARAMS = (
+    ('after', 'after', None),
+    ('limit', 'max', None),
+    ('fields', 'fields', ','.join),
+    ('authors', 'author', None),
+    ('changes', 'change', None),
+    ('has_reviewers', 'hasReviewers', _BOOL_STR.get),
+    ('ids', 'ids', None),
+    ('keywords', 'keywords', None),
+    ('participants', 'participants', None),
+    ('projects', 'project', None),
+    ('states', 'state', None),
+    ('passes_tests', 'passesTests', _BOOL_STR.get),
+    ('not_updated_since', 'notUpdatedSince', None),
+    ('has_voted', 'hasVoted', None),
+    ('my_comments', 'myComments', _BOOL_STR.get),
+)  # type: Tuple[Tuple[str, str, Optional[Callable]], ...]
+
+_GET_MANY_INFO_PARAMS = tuple(p for p in _GET_PARAMS if p[0] in ('fields', 'ids'))
 
 
 class Reviews:
@@ -101,56 +125,12 @@ class Reviews:
         Returns:
             dict: json response.
         """
-        params = dict()  # type: Dict[str, Union[int, str, bool, List[str], List[int]]]
+        if authors and float(self.swarm.version) < 2:
+            raise SwarmCompatibleError(
+                'author field is supported from API version >= 2'
+            )
 
-        if after:
-            params['after'] = after
-
-        if limit:
-            params['max'] = limit
-
-        if fields:
-            params['fields'] = ','.join(fields)
-
-        if authors:
-            params['author'] = authors
-            if float(self.swarm.version) < 2:
-                raise SwarmCompatibleError(
-                    'author field is supported from API version >= 2'
-                )
-
-        if changes:
-            params['change'] = changes
-
-        if has_reviewers is not None:
-            params['hasReviewers'] = has_reviewers
-
-        if ids:
-            params['ids'] = ids
-
-        if keywords:
-            params['keywords'] = keywords
-
-        if participants:
-            params['participants'] = participants
-
-        if projects:
-            params['project'] = projects
-
-        if states:
-            params['state'] = states
-
-        if passes_tests is not None:
-            params['passesTests'] = passes_tests
-
-        if not_updated_since:
-            params['notUpdatedSince'] = not_updated_since
-
-        if has_voted:
-            params['hasVoted'] = has_voted
-
-        if my_comments is not None:
-            params['myComments'] = my_comments
+        params = build_params(_GET_PARAMS, locals())
 
         return self.swarm._request('GET', 'reviews', params=params)
 
@@ -193,9 +173,10 @@ class Reviews:
 
         response = self.swarm._request(
             'GET',
-            'reviews/{}'.format(review_id),
+            f'reviews/{review_id}',
             fcb=callback,
-            params=params
+            params=params,
+            cached=True
         )
 
         return response
@@ -221,6 +202,44 @@ class Reviews:
         """
         return self._get_info(review_id, fields)
 
+    def get_many_info(self,
+                      ids: List[int],
+                      *,
+                      fields: Optional[List[str]] = None
+                      ) -> List[dict]:
+        """
+        Retrieve information about several reviews using single request.
+
+        Args:
+            ids (List[int]):
+                Review ids getting information from, server ignores `limit`
+                when ids are specified, so all found reviews are returned.
+
+            fields (Optional[List[str]]):
+                List of fields to show. Omitting this parameter or passing an
+                empty value shows all fields.
+
+        Returns:
+            List[dict]: list of reviews.
+        """
+        # server returns all reviews if ids filter is empty
+        if not ids:
+            raise SwarmError('At least one review id is required')
+
+        def callback(response: dict) -> List[dict]:
+            return response.get('reviews', [])
+
+        params = build_params(_GET_MANY_INFO_PARAMS, locals())
+
+        response = self.swarm._request(
+            'GET',
+            'reviews',
+            fcb=callback,
+            params=params
+        )
+
+        return response  # type: ignore
+
     @minimal_version(9)
     def get_transitions(self,
                         review_id: int,
@@ -250,7 +269,7 @@ class Reviews:
 
         response = self.swarm._request(
             'GET',
-            'reviews/{}/transitions'.format(review_id),
+            f'reviews/{review_id}/transitions',
             params=params
         )
 
@@ -322,6 +341,18 @@ class Reviews:
         Returns:
             dict: json response.
         """
+        api_version = float(self.swarm.version)
+
+        if required_reviewers and api_version == 1:
+            raise SwarmCompatibleError(
+                'required_reviewers field is supported from API version > 1'
+            )
+
+        if reviewer_groups and api_version < 7:
+            raise SwarmCompatibleError(
+                'reviewer_groups field is supported from API version > 6'
+            )
+
         data = dict(change=change)  # type: Dict[str, Union[int, str, List[str]]]
 
         if description:
@@ -332,17 +363,9 @@ class Reviews:
 
         if required_reviewers:
             data['requiredReviewers'] = required_reviewers
-            if float(self.swarm.version) == 1:
-                raise SwarmCompatibleError(
-                    'required_reviewers field is supported from API version > 1'
-                )
 
         if reviewer_groups:
             data['reviewerGroups'] = reviewer_groups
-            if float(self.swarm.version) < 7:
-                raise SwarmCompatibleError(
-                    'reviewer_groups field is supported from API version > 6'
-                )
 
         return self.swarm._request('POST', 'reviews', json=data)
 
@@ -381,7 +404,7 @@ class Reviews:
 
         response = self.swarm._request(
             'POST',
-            'reviews/{}/vote'.format(review_id),
+            f'reviews/{review_id}/vote',
             data=data
         )
 
@@ -419,7 +442,7 @@ class Reviews:
 
         response = self.swarm._request(
             'POST',
-            'reviews/{}/changes/'.format(review_id),
+            f'reviews/{review_id}/changes/',
             data=data
         )
 
@@ -488,7 +511,7 @@ class Reviews:
 
         response = self.swarm._request(
             'PATCH',
-            'reviews/{}'.format(review_id),
+            f'reviews/{review_id}',
             data=data
         )
 
@@ -521,7 +544,7 @@ class Reviews:
 
         response = self.swarm._request(
             'POST',
-            'reviews/{}/cleanup'.format(review_id),
+            f'reviews/{review_id}/cleanup',
             data=data
         )
 
@@ -541,7 +564,7 @@ class Reviews:
         """
         response = self.swarm._request(
             'POST',
-            'reviews/{}/obliterate'.format(review_id)
+            f'reviews/{review_id}/obliterate'
         )
 
         return response
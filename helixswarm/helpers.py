@@ -1,7 +1,9 @@
 import re
+import time
 
+from collections import OrderedDict
 from functools import wraps
-from typing import Callable
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
 
 from helixswarm.exceptions import SwarmCompatibleError, SwarmError
 
@@ -32,3 +34,100 @@ def get_review_id(review_url: str) -> int:
         raise SwarmError(f'Invalid review: {review_url}')
 
     return int(ret[0])
+
+
+def build_params(spec: Iterable[Tuple[str, str, Optional[Callable]]],
+                 values: Dict[str, Any],
+                 *,
+                 keep_false: bool = True
+                 ) -> Dict[str, Any]:
+    """
+    Build request parameters from table of `(argument, parameter, transform)`.
+
+    Arguments which are not set or empty are skipped, explicit ``False`` is
+    passed to the server unless `keep_false` is disabled.
+    """
+    params = dict()  # type: Dict[str, Any]
+
+    for argument, parameter, transform in spec:
+        value = values[argument]
+
+        if not value and (value is not False or not keep_false):
+            continue
+
+        params[parameter] = transform(value) if transform else value
+
+    return params
+
+
+class TTLCache:
+    """
+    Small LRU cache of response bodies, entries are expired after `ttl` seconds.
+    Keys are tuples where first item is endpoint path.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        # incremented on each invalidation, used to skip storing responses
+        # which were requested before a modifying request
+        self.generation = 0
+        self._data = OrderedDict()  # type: OrderedDict[Tuple[Hashable, ...], Tuple[float, str]]
+
+    def get(self, key: Tuple[Hashable, ...]) -> Optional[str]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+
+        expires, value = item
+        if expires < time.monotonic():
+            self._data.pop(key, None)
+            return None
+
+        try:
+            self._data.move_to_end(key)
+        except KeyError:
+            pass
+
+        return value
+
+    def set(self,
+            key: Tuple[Hashable, ...],
+            value: str,
+            generation: Optional[int] = None
+            ) -> None:
+        if generation is not None and generation != self.generation:
+            return
+
+        self._data[key] = (time.monotonic() + self.ttl, value)
+
+        while len(self._data) > self.maxsize:
+            try:
+                self._data.popitem(last=False)
+            except KeyError:
+                break
+
+    def invalidate(self, path: str) -> None:
+        """
+        Drop entries of given path and all its parent paths, for instance
+        `reviews/1/vote` invalidates `reviews/1`.
+        """
+        self.generation += 1
+
+        for key in list(self._data):
+            if path == key[0] or path.startswith(f'{key[0]}/'):
+                self._data.pop(key, None)
+
+    def invalidate_prefix(self, prefix: str) -> None:
+        """
+        Drop all entries which path starts with given prefix.
+        """
+        self.generation += 1
+
+        for key in list(self._data):
+            if str(key[0]).startswith(prefix):
+                self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._data.clear()
@@ -4,7 +4,7 @@ import re
 from abc import ABC, abstractmethod
 from collections import namedtuple
 from http import HTTPStatus
-from typing import Any, Callable, Coroutine, Optional, Tuple, Union
+from typing import Any, Callable, Coroutine, List, Optional, Tuple, Union
 
 from helixswarm.endpoints.activities import Activities
 from helixswarm.endpoints.changes import Changes
@@ -21,7 +21,7 @@ from helixswarm.exceptions import (
     SwarmNotFoundError,
     SwarmUnauthorizedError,
 )
-from helixswarm.helpers import minimal_version
+from helixswarm.helpers import TTLCache, minimal_version
 
 Response = namedtuple('Response', ['status', 'body'])
 
@@ -29,6 +29,8 @@ Response = namedtuple('Response', ['status', 'body'])
 class Swarm(ABC):
 
     auth_update_callback = None
+    api_versions = None  # type: Optional[List[float]]
+    cache = None  # type: Optional[TTLCache]
 
     def __init__(self) -> None:
         self.activities = Activities(self)
@@ -61,6 +63,44 @@ class Swarm(ABC):
         if retry.get('total', 0) <= 0:
             raise SwarmError('Invalid `total` in retry argument must be > 0')
 
+    def _get_cache_key(self, path: str, cached: bool, kwargs: dict) -> Optional[tuple]:
+        if not cached or self.cache is None:
+            return None
+
+        params = kwargs.get('params') or {}
+        return (path,) + tuple(sorted((k, str(v)) for k, v in params.items()))
+
+    def _cache_get(self, key: Optional[tuple]) -> Tuple[Optional[str], int]:
+        """
+        Return cached response body (if any) and current cache generation,
+        generation must be passed to `_cache_set()` after request is done.
+        """
+        if key is None or self.cache is None:
+            return None, 0
+
+        return self.cache.get(key), self.cache.generation
+
+    def _cache_set(self,
+                   key: Optional[tuple],
+                   status: int,
+                   body: str,
+                   generation: int
+                   ) -> None:
+        if key is None or self.cache is None or status != HTTPStatus.OK:
+            return
+
+        self.cache.set(key, body, generation)
+
+    def _invalidate_cache(self, method: str, path: str) -> None:
+        if self.cache is None or method == 'GET':
+            return
+
+        # archiving changes state of any review matching the filter
+        if path == 'reviews/archive':
+            self.cache.invalidate_prefix('reviews/')
+        else:
+            self.cache.invalidate(path)
+
     @staticmethod
     def _callback(response: Response, fcb: Callable) -> dict:
         if response.status == HTTPStatus.UNAUTHORIZED:
@@ -97,6 +137,8 @@ class Swarm(ABC):
                 method: str,
                 path: str,
                 fcb: Optional[Callable] = None,
+                *,
+                cached: bool = False,
                 **kwargs: Any
                 ) -> dict:
         raise NotImplementedError
@@ -128,7 +170,25 @@ class Swarm(ABC):
         Returns:
             dict: server version.
         """
-        return self._request('GET', 'version')
+        def callback(response: dict) -> dict:
+            self.api_versions = response.get('apiVersions', [])
+            return response
+
+        return self._request('GET', 'version', fcb=callback)
+
+    def _request_data(self, method: str, path: str, data: dict) -> dict:
+        """
+        Send data as JSON for servers supporting API v11+ and as form
+        otherwise. Server version is requested only once and then cached for
+        the client lifetime.
+        """
+        if self.api_versions is None:
+            self.get_version()
+
+        if 11 in self.api_versions:  # type: ignore
+            return self._request(method, path, json=data)
+
+        return self._request(method, path, data=data)
 
     @minimal_version(9)
     def check_auth(self, token: Optional[str] = None) -> dict:
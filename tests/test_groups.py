@@ -1,9 +1,12 @@
+import json
 import re
 
+from urllib.parse import parse_qs
+
 import pytest
 import responses
 
-from helixswarm import SwarmClient, SwarmError
+from helixswarm import SwarmAsyncClient, SwarmClient, SwarmError
 
 
 @responses.activate
@@ -90,6 +93,35 @@ def test_groups_get_info():
     assert 'group' in response
 
 
+@responses.activate
+def test_groups_get_info_cache():
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/api/v\d+/groups/my-group'),
+        json={'group': {'Group': 'my-group'}}
+    )
+
+    responses.add(
+        responses.PATCH,
+        re.compile(r'.*/api/v\d+/groups/my-group'),
+        json={'group': {'Group': 'my-group'}}
+    )
+
+    client = SwarmClient('http://server/api/v2', 'user', 'password', cache_ttl=60)
+
+    client.groups.get_info('my-group', fields=['Group'])
+    client.groups.get_info('my-group', fields=['Group'])
+    assert len(responses.calls) == 1
+
+    client.groups.get_info('my-group', fields=['Users'])
+    assert len(responses.calls) == 2
+
+    client.groups.edit('my-group', name='My Group')
+    response = client.groups.get_info('my-group', fields=['Group'])
+    assert response['group']['Group'] == 'my-group'
+    assert len(responses.calls) == 4
+
+
 @responses.activate
 def test_group_create():
     data = {
@@ -115,6 +147,12 @@ def test_group_create():
         }
     }
 
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/api/v\d+/version'),
+        json={'apiVersions': [1, 1.1, 1.2, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11]}
+    )
+
     responses.add(
         responses.POST,
         re.compile(r'.*/api/v\d+/groups'),
@@ -137,10 +175,80 @@ def test_group_create():
         notify_commits=True,
         email_address='my-group@host.domain',
         use_mailing_list=True,
+        max_results=100,
+        timeout=60,
     )
 
     assert 'group' in response
 
+    request = responses.calls[-1].request
+    assert request.headers['Content-Type'] == 'application/json'
+    assert json.loads(request.body) == {
+        'Group': 'my-group',
+        'Users': ['bruno', 'user2'],
+        'Owners': ['alice', 'bob'],
+        'Subgroups': ['subgroup_1'],
+        'config[name]': 'My Group',
+        'config[description]': 'This group is special to me.',
+        'config[emailAddress]': 'my-group@host.domain',
+        'config[emailFlags][reviews]': True,
+        'config[emailFlags][commits]': True,
+        'config[useMailingList]': True,
+        'MaxResults': 100,
+        'Timeout': 60,
+    }
+
+    # server version is requested only once
+    client.groups.create('my-group', users=['bruno'])
+    assert len([c for c in responses.calls if c.request.url.endswith('/version')]) == 1
+
+
+@responses.activate
+def test_group_create_form():
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/api/v\d+/version'),
+        json={'apiVersions': [1, 1.1, 1.2, 2, 3, 4, 5, 6, 7, 8, 9, 10]}
+    )
+
+    responses.add(
+        responses.POST,
+        re.compile(r'.*/api/v\d+/groups'),
+        json={'group': {'Group': 'my-group'}}
+    )
+
+    client = SwarmClient('http://server/api/v2', 'user', 'password')
+
+    client.groups.create('my-group', users=['bruno'])
+
+    request = responses.calls[-1].request
+    assert request.headers['Content-Type'] == 'application/x-www-form-urlencoded'
+    assert request.body == 'Group=my-group&Users=bruno'
+
+
+@pytest.mark.asyncio
+async def test_group_create_async(aiohttp_mock):
+    aiohttp_mock.get(
+        re.compile(r'.*/api/v\d+/version'),
+        payload={'apiVersions': [1, 1.1, 1.2, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11]},
+    )
+
+    aiohttp_mock.post(
+        re.compile(r'.*/api/v\d+/groups'),
+        payload={'group': {'Group': 'my-group'}},
+        repeat=True,
+    )
+
+    async with SwarmAsyncClient('http://server/api/v2', 'user', 'password') as client:
+        response = await client.groups.create('my-group', users=['bruno'])
+        assert response['group']['Group'] == 'my-group'
+
+        # version is cached, so only POST is mocked for second call
+        await client.groups.create('my-group', users=['bruno'])
+
+    requests = [r for (method, _), r in aiohttp_mock.requests.items() if method == 'POST']
+    assert requests[0][0].kwargs['json'] == {'Group': 'my-group', 'Users': ['bruno']}
+
 
 @responses.activate
 def test_edit():
@@ -186,6 +294,18 @@ def test_edit():
 
     assert 'group' in response
 
+    assert parse_qs(responses.calls[-1].request.body) == {
+        'Users': ['Pedro', 'Pablo'],
+        'Owners': ['root'],
+        'Subgroups': ['subgroup_2'],
+        'config[name]': ['My Group'],
+        'config[description]': ['This group is special to me.'],
+        'config[emailAddress]': ['test-group@host.domain'],
+        'config[emailFlags][reviews]': ['True'],
+        'config[emailFlags][commits]': ['True'],
+        'config[useMailingList]': ['True'],
+    }
+
 
 @responses.activate
 def test_delete():
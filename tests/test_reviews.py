@@ -1,3 +1,4 @@
+import asyncio
 import re
 
 import pytest
@@ -103,6 +104,14 @@ def test_get_parameters():
 
     assert len(reviews['reviews']) == 2
 
+    params = responses.calls[0].request.params
+    assert params['max'] == '2'
+    assert params['fields'] == 'id,description,author,state'
+    assert params['change'] == ['123', '456']
+    assert params['hasReviewers'] == '1'
+    assert params['passesTests'] == '1'
+    assert 'ids' not in params
+
 
 def test_get_exceptions():
     client = SwarmClient('http://server/api/v1.2', 'user', 'password')
@@ -177,6 +186,152 @@ def test_get_info():
     assert reviews['review']['id'] == 12204
 
 
+@responses.activate
+def test_get_many_info():
+    data = {
+        'lastSeen': 12206,
+        'reviews': [
+            {'id': 12204, 'author': 'bruno'},
+            {'id': 12206, 'author': 'swarm'}
+        ],
+        'totalCount': 2
+    }
+
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/api/v\d+/reviews'),
+        json=data
+    )
+
+    client = SwarmClient('http://server/api/v9', 'user', 'password')
+
+    reviews = client.reviews.get_many_info([12204, 12206], fields=['id', 'author'])
+    assert [r['id'] for r in reviews] == [12204, 12206]
+    assert len(responses.calls) == 1
+
+    params = responses.calls[0].request.params
+    assert params['ids'] == ['12204', '12206']
+    assert params['fields'] == 'id,author'
+
+    with pytest.raises(SwarmError):
+        client.reviews.get_many_info([])
+
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_get_info_cache():
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/api/v\d+/reviews/12204'),
+        json={'review': {'id': 12204}}
+    )
+
+    responses.add(
+        responses.POST,
+        re.compile(r'.*/api/v\d+/reviews/12204/vote'),
+        json={'isValid': True}
+    )
+
+    responses.add(
+        responses.PATCH,
+        re.compile(r'.*/api/v\d+/reviews/12204'),
+        json={'review': {'id': 12204}}
+    )
+
+    client = SwarmClient('http://server/api/v9', 'user', 'password', cache_ttl=60)
+
+    def get_calls():
+        return [c for c in responses.calls if c.request.method == 'GET']
+
+    client.reviews.get_info(12204)
+    client.reviews.get_info(12204)
+    assert len(get_calls()) == 1
+
+    client.reviews.vote(12204, 'up')
+    client.reviews.get_info(12204)
+    assert len(get_calls()) == 2
+
+    client.reviews.update(12204, description='new')
+    response = client.reviews.get_info(12204)
+    assert response['review']['id'] == 12204
+    assert len(get_calls()) == 3
+
+
+@responses.activate
+def test_get_info_cache_archive():
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/api/v\d+/reviews/12204'),
+        json={'review': {'id': 12204, 'state': 'needsReview'}}
+    )
+
+    responses.add(
+        responses.POST,
+        re.compile(r'.*/api/v\d+/reviews/archive'),
+        json={'archivedReviews': [{'id': 12204}], 'failedReviews': []}
+    )
+
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/api/v\d+/reviews/12204'),
+        json={'review': {'id': 12204, 'state': 'archived'}}
+    )
+
+    client = SwarmClient('http://server/api/v9', 'user', 'password', cache_ttl=60)
+
+    client.reviews.get_info(12204)
+    client.reviews.archive(not_updated_since='2017-01-01', description='archive')
+
+    response = client.reviews.get_info(12204)
+    assert response['review']['state'] == 'archived'
+    assert len([c for c in responses.calls if c.request.method == 'GET']) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_info_cache_async(aiohttp_mock):
+    aiohttp_mock.get(
+        re.compile(r'.*/api/v\d+/reviews/12204'),
+        payload={'review': {'id': 12204}},
+    )
+
+    async with SwarmAsyncClient('http://server/api/v9', 'user', 'password',
+                                cache_ttl=60) as client:
+        await client.reviews.get_info(12204)
+        assert client.cache.get(('reviews/12204',)) is not None
+
+        # second call is served from cache, only one response is mocked
+        response = await client.reviews.get_info(12204)
+        assert response['review']['id'] == 12204
+
+
+@pytest.mark.asyncio
+async def test_get_info_cache_async_concurrent_update(aiohttp_mock):
+    async def slow_response(*args, **kwargs):
+        # old review body arrives after update is finished
+        await asyncio.sleep(0.01)
+
+    aiohttp_mock.get(
+        re.compile(r'.*/api/v\d+/reviews/12204'),
+        payload={'review': {'id': 12204, 'description': 'old'}},
+        callback=slow_response,
+    )
+
+    aiohttp_mock.patch(
+        re.compile(r'.*/api/v\d+/reviews/12204'),
+        payload={'review': {'id': 12204, 'description': 'new'}},
+    )
+
+    async with SwarmAsyncClient('http://server/api/v9', 'user', 'password',
+                                cache_ttl=60) as client:
+        await asyncio.gather(
+            client.reviews.get_info(12204),
+            client.reviews.update(12204, description='new'),
+        )
+
+        assert client.cache.get(('reviews/12204',)) is None
+
+
 @responses.activate
 def test_get_info_error():
     data = {
@@ -331,6 +486,22 @@ async def test_get_latest_revision_and_change_async(aiohttp_mock):
     await client.close()
 
 
+@pytest.mark.asyncio
+async def test_get_info_async_gather(aiohttp_mock):
+    for review_id in (1, 2, 3):
+        aiohttp_mock.get(
+            re.compile(rf'.*/api/v\d+/reviews/{review_id}'),
+            payload={'review': {'id': review_id}},
+        )
+
+    async with SwarmAsyncClient('http://server/api/v9', 'user', 'password') as client:
+        reviews = await asyncio.gather(*(
+            client.reviews.get_info(review_id) for review_id in (1, 2, 3)
+        ))
+
+    assert [r['review']['id'] for r in reviews] == [1, 2, 3]
+
+
 @responses.activate
 def test_get_latest_revision_and_change_exception():
     client = SwarmClient('http://server/api/v9', 'user', 'password')
@@ -7,6 +7,7 @@ import pytest
 import responses
 
 from helixswarm import SwarmAsyncClient, SwarmClient, SwarmError
+from helixswarm.helpers import TTLCache
 
 GET_VERSION_DATA = {
     'apiVersions': [1, 1.1, 1.2, 2, 3, 4, 5, 6, 7, 8, 9],
@@ -52,6 +53,26 @@ def test_retry_argument_validation():
         )
 
 
+def test_ttl_cache(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr('helixswarm.helpers.time.monotonic', lambda: now[0])
+
+    cache = TTLCache(10, maxsize=2)
+    cache.set(('reviews/1',), '1')
+    cache.set(('reviews/2',), '2')
+    assert cache.get(('reviews/1',)) == '1'
+
+    # least recently used entry is dropped
+    cache.set(('reviews/3',), '3')
+    assert cache.get(('reviews/2',)) is None
+
+    cache.invalidate('reviews/1/vote')
+    assert cache.get(('reviews/1',)) is None
+
+    now[0] = 11
+    assert cache.get(('reviews/3',)) is None
+
+
 @responses.activate
 def test_response_invalid_json():
     responses.add(
@@ -105,6 +126,29 @@ def test_sync_client():
         client.close()
 
 
+@responses.activate
+def test_sync_client_context_manager(monkeypatch):
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/api/v\d+/version'),
+        json=GET_VERSION_DATA,
+        status=200
+    )
+
+    closed = []
+
+    with SwarmClient('http://server/api/v9', 'user', 'password') as client:
+        session = client.session
+        monkeypatch.setattr(session, 'close', lambda: closed.append(True))
+
+        client.get_version()
+        client.get_version()
+        assert client.session is session
+        assert not closed
+
+    assert closed == [True]
+
+
 @responses.activate
 def test_sync_client_retry():
     # responses library does`t support Retry mock
@@ -146,6 +190,14 @@ async def test_async_client(aiohttp_mock):
         await client.close()
 
 
+@pytest.mark.asyncio
+async def test_async_client_context_manager():
+    async with SwarmAsyncClient('http://server/api/v9', 'user', 'password') as client:
+        assert not client.session.closed
+
+    assert client.session.closed
+
+
 @pytest.mark.asyncio
 async def test_async_client_retry(aiohttp_mock):
     client = SwarmAsyncClient(